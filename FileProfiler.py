@@ -8,24 +8,56 @@ statistics for a directory. The `calc_statistics` function analyzes files in a g
 categorize them based on types such as images, documents, or others, and retrieves statistical
 details like total size, counts, and the newest file in each category.
 """
+import functools
+import heapq
+import math
+import operator
 import os
-import re
-from datetime import datetime
+import sys
+import time
+from collections import defaultdict
+
+# Lowercase extension -> category bucket. Compound suffixes such as "tar.gz" are
+# looked up by _bucket_for when the last extension alone is unknown.
+_EXT_TO_BUCKET = {
+    "jpg": "images", "jpeg": "images", "png": "images",
+    "pdf": "documents", "docx": "documents", "xlsx": "documents", "pptx": "documents",
+    "mp3": "music", "wav": "music", "flac": "music",
+    "mp4": "videos", "mkv": "videos", "mov": "videos", "wmv": "videos", "m4v": "videos",
+    "py": "code_scripts", "js": "code_scripts", "cpp": "code_scripts", "java": "code_scripts",
+    "zip": "archives", "tar.gz": "archives", "tar.bz2": "archives",
+}
+
+_BYTES_PER_MB_INV = 1.0 / (1024 * 1024)
+
+_MONTH_ABBREVIATIONS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun",
+                        "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+# Report order and wording for each category: (bucket, heading, plural, singular).
+_CATEGORIES = (
+    ("images", "Images", "image(s)", "image"),
+    ("documents", "Documents", "document(s)", "document"),
+    ("music", "Music", "music", "music"),
+    ("videos", "Videos", "video(s)", "video"),
+    ("code_scripts", "Code/Scripts", "code/script(s)", "code/script"),
+    ("archives", "Archives", "archive(s)", "archive"),
+    ("others", "Other Files", "other file(s)", "file"),
+)
 
 def convert_to_megabytes(size_in_bytes):
     """
-    Converts a given size in bytes to megabytes with precision up to two decimal points.
+    Converts a given size in bytes to megabytes with precision up to five decimal points.
 
     This function takes an input size in bytes and converts it into megabytes by
-    dividing it by the number of bytes in a megabyte (1024 * 1024). The result
-    is rounded to two decimal places.
+    multiplying it by the reciprocal of the number of bytes in a megabyte
+    (1024 * 1024). The result is rounded to five decimal places.
 
     :param size_in_bytes: The size in bytes to be converted.
     :type size_in_bytes: int
-    :return: The converted size in megabytes, rounded to two decimal places.
+    :return: The converted size in megabytes, rounded to five decimal places.
     :rtype: float
     """
-    return round(size_in_bytes / (1024 * 1024), 5)
+    return round(size_in_bytes * _BYTES_PER_MB_INV, 5)
 
 def find_key_dict(dictionary, value):
     """
@@ -63,179 +95,240 @@ def format_date(timestamp):
     :return: A formatted UTC date-time string in the "YYYY-Mon-DD HH:MM:SS" format.
     :rtype: str
     """
-    utc_time = datetime.utcfromtimestamp(timestamp) #Converts seconds to utc time
-    formated_datetime = utc_time.strftime("%Y-%b-%d %H:%M:%S") #Converts utc time to human readable format
-    return formated_datetime
+    return _format_utc_second(math.floor(timestamp)) #Files created in the same second share a cache entry
+
+@functools.lru_cache(maxsize=4096)
+def _format_utc_second(seconds):
+    """
+    Formats a whole-second Unix timestamp as "YYYY-Mon-DD HH:MM:SS" in UTC.
+
+    The month abbreviation comes from a fixed table rather than ``strftime``,
+    so the output does not depend on the current locale.
+
+    :param seconds: Whole seconds since the epoch.
+    :type seconds: int
+    :return: The formatted UTC date-time string.
+    :rtype: str
+    """
+    utc_time = time.gmtime(seconds)
+    return (f"{utc_time.tm_year}-{_MONTH_ABBREVIATIONS[utc_time.tm_mon - 1]}-{utc_time.tm_mday:02d} "
+            f"{utc_time.tm_hour:02d}:{utc_time.tm_min:02d}:{utc_time.tm_sec:02d}")
 
 def find_three_largest(custom_dict):
-    if len(custom_dict) < 1:
-        return custom_dict
-    if len(custom_dict) == 1:
-        return f"{list(custom_dict.keys())[0]} - {list(custom_dict.values())[0]}MB"
-    else:
-        sorted_values = list(custom_dict.values())[:3] if len(custom_dict) >= 3 else list(custom_dict.values())
-        sorted_values.sort(reverse=True)
-        new_list = []
-        for item in sorted_values:
-            key = find_key_dict(custom_dict, item)
-            new_list.append(f"{find_key_dict(custom_dict, item)} - {custom_dict[key]}MB")
-        new_list.sort(reverse=True)
-        return ", ".join(new_list)
+    """
+    Builds a summary of the three largest entries in a dictionary of sizes.
+
+    The entries are ordered from largest to smallest and formatted as
+    "name - sizeMB", separated by commas. Dictionaries with fewer than three
+    entries are summarised in full.
+
+    :param custom_dict: A dictionary mapping names to sizes in megabytes.
+    :type custom_dict: dict
+    :return: A comma-separated string of the largest entries, or an empty string
+        if the dictionary is empty.
+    :rtype: str
+    """
+    if not custom_dict:
+        return ""
+    top = heapq.nlargest(3, custom_dict.items(), key=operator.itemgetter(1))
+    return ", ".join(f"{key} - {value}MB" for key, value in top)
 
 
 
 
-def directory_audit(directory):
+def _new_bucket():
     """
-    Calculates statistics of files in the given directory, categorizing them into images, documents,
-    and other files. For each category, it calculates the total size (in megabytes),
-    counts the number of files, and identifies the most recently modified file.
+    Creates an empty record for one file category.
 
-    :param directory: Path to the directory to scan for file statistics
-    :type directory: str
-    :return: None
+    Used as the ``defaultdict`` factory in ``directory_audit``, so a record only
+    exists for categories that actually contain files. Files are collected as
+    parallel lists of names, creation times and sizes, which ``_reduce_bucket``
+    summarises once the scan is complete.
+
+    :return: A record with empty "names", "ctimes" and "sizes" lists.
+    :rtype: dict
+    """
+    return {"names": [], "ctimes": [], "sizes": []}
+
+def _format_largest(largest):
     """
-    images = {}
-    images_sizes = {}
-    documents = {}
-    documents_sizes = {}
-    others = {}
-    others_sizes = {}
-    music = {}
-    music_sizes = {}
-    videos = {}
-    videos_sizes = {}
-    code_scripts = {}
-    code_scripts_sizes = {}
-    archives = {}
-    archives_sizes = {}
-    directory_entries = os.scandir(directory)
-    image_extension_pattern = re.compile(r"\.(jpg|jpeg|png)$")
-    docs_extension_pattern = re.compile(r"\.(pdf|docx|xlsx|pptx)$")
-    music_regex = re.compile(r"\.(mp4|wav|flac)$")
-    video_regex = re.compile(r"\.(mp4|mkv|mov|wmv|m4v)$")
-    code_scripts_regex = re.compile(r"\.(py|js|cpp|java)$")
-    archive_regex = re.compile(r"\.(zip|tar.gz|tar.bz2)$")
-    for directory_entry in directory_entries:
-        if directory_entry.is_file():
-            if image_extension_pattern.search(directory_entry.name):
-                images[directory_entry.name] = directory_entry.stat().st_ctime
-                images_sizes[directory_entry.name] = convert_to_megabytes(directory_entry.stat().st_size)
-            elif docs_extension_pattern.search(directory_entry.name):
-                documents_sizes[directory_entry.name] = convert_to_megabytes(directory_entry.stat().st_size)
-                documents[directory_entry.name] = directory_entry.stat().st_ctime
-            elif music_regex.search(directory_entry.name):
-                music_sizes[directory_entry.name] = convert_to_megabytes(directory_entry.stat().st_size)
-                music[directory_entry.name] = directory_entry.stat().st_ctime
-            elif video_regex.search(directory_entry.name):
-                videos_sizes[directory_entry.name] = convert_to_megabytes(directory_entry.stat().st_size)
-                videos[directory_entry.name] = directory_entry.stat().st_ctime
-            elif code_scripts_regex.search(directory_entry.name):
-                code_scripts_sizes[directory_entry.name] = convert_to_megabytes(directory_entry.stat().st_size)
-                code_scripts[directory_entry.name] = directory_entry.stat().st_ctime
-            elif archive_regex.search(directory_entry.name):
-                archives_sizes[directory_entry.name] = convert_to_megabytes(directory_entry.stat().st_size)
-                archives[directory_entry.name] = directory_entry.stat().st_ctime
-            else:
-                others_sizes[directory_entry.name] = convert_to_megabytes(directory_entry.stat().st_size)
-                others[directory_entry.name] = directory_entry.stat().st_ctime
-
-
-
-    if not images:
-        print("No images found in the directory.")
-    else:
-        print("__________________________________________________")
-        print("Images:")
-        print("")
-        print(f"Found {len(images)} Image(s) taking up {sum(list(images_sizes.values()))}MB\n"
-              f"Newest image: {find_key_dict(images, max(images.values()))}\n"
-              f"({format_date(max((images.values())))}) Oldest Image: {find_key_dict(images, min(images.values()))} ({format_date(min((images.values())))})\n"
-              f"Largest documents: {find_three_largest(images_sizes)}")
-        print("__________________________________________________")
-        print("")
-    if not documents:
-        print("No documents found in the directory.")
-    else:
-        print("__________________________________________________")
-        print("Documents:")
-        print("")
-        print(f"Found {len(documents)} document(s) taking up {sum(list(documents_sizes.values()))}MB\n"
-              f"Newest document: {find_key_dict(documents, max(documents.values()))} ({format_date(max(documents.values()))})\n"
-              f"Oldest document: {find_key_dict(documents, min(documents.values()))} ({format_date(min((documents.values())))})\n"
-              f"Largest documents: {find_three_largest(documents_sizes)}")
-        print("__________________________________________________")
-        print("")
-
-    if not music:
-        print("No music found in the directory.")
-    else:
-        print("__________________________________________________")
-        print("Music:")
-        print("")
-        print(f"Found {len(music)} music taking up {sum(list(music_sizes.values()))}MB\n"
-              f"Newest music: {find_key_dict(music, max(music.values()))} ({format_date(max(music.values()))})\n"
-              f"Oldest music: {find_key_dict(music, min(music.values()))} ({format_date(min((music.values())))})\n"
-              f"Largest music: {find_three_largest(music_sizes)}")
-        print("__________________________________________________")
-        print("")
-
-    if not videos:
-        print("No video found in the directory.")
-    else:
-        print("__________________________________________________")
-        print("Videos:")
-        print("")
-        print(f"Found {len(videos)} video(s) taking up {sum(list(videos_sizes.values()))}MB\n"
-              f"Newest video: {find_key_dict(videos, max(videos.values()))} ({format_date(max(videos.values()))})\n"
-              f"Oldest video: {find_key_dict(videos, min(videos.values()))} ({format_date(min((videos.values())))})\n"
-              f"Largest videos: {find_three_largest(videos_sizes)}")
-        print("__________________________________________________")
-        print("")
-
-    if not code_scripts:
-        print("No code/scripts found in the directory.")
-    else:
-        print("__________________________________________________")
-        print("Code/Scripts:")
-        print("")
-        print(f"Found {len(code_scripts)} document(s) taking up {sum(list(code_scripts_sizes.values()))}MB\n"
-              f"Newest  code/script: {find_key_dict(code_scripts, max(code_scripts.values()))} ({format_date(max(code_scripts.values()))})\n"
-              f"Oldest code/script: {find_key_dict(code_scripts, min(code_scripts.values()))} ({format_date(min((code_scripts.values())))})\n"
-              f"Largest code/scripts: {find_three_largest(code_scripts_sizes)}")
-        print("__________________________________________________")
-        print("")
-
-    if not archives:
-        print("No archive found in the directory.")
-    else:
-        print("__________________________________________________")
-        print("Archives:")
-        print("")
-        print(f"Found {len(archives)} archive(s) taking up {sum(list(archives_sizes.values()))}MB\n"
-              f"Newest Archive: {find_key_dict(archives, max(archives.values()))} ({format_date(max(archives.values()))})\n"
-              f"Oldest Archive: {find_key_dict(archives, min(archives.values()))} ({format_date(min((archives.values())))})\n"
-              f"Largest Archives: {find_three_largest(archives_sizes)}")
-        print("__________________________________________________")
-        print("")
-
-
-    if not others:
-        print("No other files found in the directory.")
-    else:
-        print("__________________________________________________")
-        print("OTHER FILES:")
-        print("")
-        print(f"Found {len(others)} other file(s) taking up {sum(list(others_sizes.values()))}MB\n"
-              f"Newest file: {find_key_dict(others, max(others.values()))} ({format_date(max(others.values()))})\n"
-              f"Oldest document: {find_key_dict(others, min(others.values()))} ({format_date(min((others.values())))})\n"
-              f"Largest documents: {find_three_largest(others_sizes)}")
-        print("__________________________________________________")
-        print("")
+    Formats a list of ``(size, name)`` pairs, largest first, as "name - sizeMB" entries.
 
+    :param largest: The largest files in a category as ``(size_in_bytes, name)`` pairs,
+        in descending order of size.
+    :type largest: list
+    :return: A comma-separated string of the largest files.
+    :rtype: str
+    """
+    return ", ".join(f"{name} - {convert_to_megabytes(size)}MB" for size, name in largest)
 
+def _classify_one(directory_entry):
+    """
+    Stats and classifies a single file entry.
+
+    :param directory_entry: The file entry to classify.
+    :type directory_entry: os.DirEntry
+    :return: A ``(bucket, path, size_in_bytes, ctime)`` tuple, or None if the file
+        cannot be stat'ed, e.g. because it was removed after the directory was listed
+        or its directory is not searchable.
+    :rtype: tuple or None
+    """
+    try:
+        entry_stat = directory_entry.stat()
+    except OSError:
+        return None
+    return _bucket_for(directory_entry.name), directory_entry.path, entry_stat.st_size, entry_stat.st_ctime
 
+def _reduce_bucket(names, ctimes, sizes):
+    """
+    Reduces the parallel name, creation time and size lists of one category to
+    its report statistics.
+
+    The total, newest and oldest file come from ``sum``, ``max``, ``min`` and
+    ``list.index``, which loop in C. The three largest files come from
+    ``heapq.nlargest``, which is implemented in Python and iterates every
+    ``(size, name)`` pair as bytecode.
+
+    :param names: File names in the category.
+    :type names: list
+    :param ctimes: Creation timestamps, aligned with ``names``.
+    :type ctimes: list
+    :param sizes: File sizes in bytes, aligned with ``names``.
+    :type sizes: list
+    :return: A dict with "count" and, for non-empty categories, "size_sum",
+        "max_t", "max_name", "min_t", "min_name" and "top3".
+    :rtype: dict
+    """
+    if not names:
+        return {"count": 0}
+    newest = max(ctimes)
+    oldest = min(ctimes)
+    return {"count": len(names),
+            "size_sum": sum(sizes),
+            "max_t": newest, "max_name": names[ctimes.index(newest)],
+            "min_t": oldest, "min_name": names[ctimes.index(oldest)],
+            "top3": heapq.nlargest(3, zip(sizes, names))}
+
+def _emit_category(report, heading, plural, singular, summary):
+    """
+    Appends the report section for one file category to ``report``.
+
+    :param report: The list of report lines being built.
+    :type report: list
+    :param heading: The section heading, e.g. "Images".
+    :type heading: str
+    :param plural: The label used when counting files, e.g. "image(s)".
+    :type plural: str
+    :param singular: The label used for a single file, e.g. "image".
+    :type singular: str
+    :param summary: The category statistics returned by ``_reduce_bucket``.
+    :type summary: dict
+    :return: None
+    """
+    if not summary["count"]:
+        report.append(f"No {heading.lower()} found in the directory.")
+        return
+    report.append("__________________________________________________")
+    report.append(f"{heading}:")
+    report.append("")
+    report.append(f"Found {summary['count']} {plural} taking up {convert_to_megabytes(summary['size_sum'])}MB\n"
+                  f"Newest {singular}: {summary['max_name']} ({format_date(summary['max_t'])})\n"
+                  f"Oldest {singular}: {summary['min_name']} ({format_date(summary['min_t'])})\n"
+                  f"Largest {heading.lower()}: {_format_largest(summary['top3'])}")
+    report.append("__________________________________________________")
+    report.append("")
+
+def _bucket_for(name):
+    """
+    Looks up the category bucket for a file name based on its extension.
 
+    The last extension is tried first; if it is unknown, the last two extensions
+    are tried together so that compound suffixes such as ".tar.gz" are recognised.
 
+    :param name: The file name to classify.
+    :type name: str
+    :return: The bucket name, or "others" if the extension is not recognised.
+    :rtype: str
+    """
+    dot = name.rfind(".")
+    if dot < 0:
+        return "others"
+    ext = name[dot + 1:]
+    # Every known extension is ASCII, so a non-ASCII one can be rejected without
+    # case folding, and ASCII strings take str.lower's fast path.
+    if not ext.isascii():
+        return "others"
+    bucket = _EXT_TO_BUCKET.get(ext.lower())
+    if bucket is None:
+        previous_dot = name.rfind(".", 0, dot)
+        if previous_dot >= 0:
+            compound_ext = name[previous_dot + 1:]
+            if compound_ext.isascii():
+                bucket = _EXT_TO_BUCKET.get(compound_ext.lower())
+    return bucket or "others"
 
+def directory_audit(directory):
+    """
+    Calculates statistics of files in the given directory and all of its subdirectories,
+    categorizing them into images, documents, and other files. For each category, it calculates
+    the total size (in megabytes), counts the number of files, and identifies the most recently
+    modified file. Files are reported by their path relative to ``directory``. Symbolic links
+    are not followed. Subdirectories and files that cannot be read, including any removed
+    during the scan, are skipped and counted in a closing "Skipped N unreadable entries" line.
 
+    :param directory: Path to the directory to scan for file statistics
+    :type directory: str
+    :return: None
+    """
+    buckets = defaultdict(_new_bucket)
+    file_entries = []
+    skipped_entries = 0
+    pending_directories = [directory]
+    while pending_directories:
+        current_directory = pending_directories.pop()
+        try:
+            with os.scandir(current_directory) as directory_entries:
+                for directory_entry in directory_entries:
+                    # DirEntry answers both checks from the d_type returned by readdir,
+                    # so no stat is issued just to tell directories from files. Where
+                    # the filesystem reports DT_UNKNOWN they fall back to a stat, which
+                    # can fail for this entry alone.
+                    try:
+                        if directory_entry.is_dir(follow_symlinks=False):
+                            pending_directories.append(directory_entry.path)
+                        elif directory_entry.is_file(follow_symlinks=False):
+                            file_entries.append(directory_entry)
+                    except OSError:
+                        skipped_entries += 1
+        except OSError:
+            # Subdirectories may be unreadable, or vanish while the tree is walked.
+            if current_directory == directory:
+                raise
+            skipped_entries += 1
+    prefix_length = len(os.path.join(directory, ""))
+    for directory_entry in file_entries:
+        classified = _classify_one(directory_entry)
+        if classified is None:
+            skipped_entries += 1
+            continue
+        bucket, path, size, ctime = classified
+        record = buckets[bucket]
+        record["names"].append(path[prefix_length:])
+        record["ctimes"].append(ctime)
+        record["sizes"].append(size)
+
+    report = []
+    for key, heading, plural, singular in _CATEGORIES:
+        if key in buckets:
+            record = buckets[key]
+            summary = _reduce_bucket(record["names"], record["ctimes"], record["sizes"])
+        else:
+            summary = {"count": 0}
+        _emit_category(report, heading, plural, singular, summary)
+    if skipped_entries:
+        report.append(f"Skipped {skipped_entries} unreadable entries.")
+    sys.stdout.write("\n".join(report) + "\n")
+
+
+if __name__ == "__main__":
+    directory_audit(sys.argv[1] if len(sys.argv) > 1 else os.getcwd())